@@ -1,22 +1,35 @@
 import csv
+import itertools
+import operator
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from pathlib import Path
 from errors import ErrorCategory, ErrorSeverity, LoaderError
 
-VALID_FUNCTION_KEYS = {'F1', 'F2', 'F3', 'F4', 'F5', 'F6', 
-                       'F7', 'F8', 'F9', 'F10', 'F11', 'F12'}
-VALID_LETTERS = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-VALID_NUMBERS = set('0123456789')
-VALID_SPECIAL_KEYS = {'SPACE', 'ENTER', 'TAB', 'ESC', 'BACKSPACE', 
-                      'DELETE', 'HOME', 'END', 'PAGEUP', 'PAGEDOWN',
-                      'INSERT', 'UP', 'DOWN', 'LEFT', 'RIGHT'}
-VALID_MODIFIERS = {'CTRL', 'ALT', 'SHIFT', 'WIN'}
+VALID_FUNCTION_KEYS = frozenset({'F1', 'F2', 'F3', 'F4', 'F5', 'F6', 
+                                 'F7', 'F8', 'F9', 'F10', 'F11', 'F12'})
+VALID_LETTERS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+VALID_NUMBERS = frozenset('0123456789')
+VALID_SPECIAL_KEYS = frozenset({'SPACE', 'ENTER', 'TAB', 'ESC', 'BACKSPACE', 
+                                'DELETE', 'HOME', 'END', 'PAGEUP', 'PAGEDOWN',
+                                'INSERT', 'UP', 'DOWN', 'LEFT', 'RIGHT'})
+VALID_MODIFIERS = frozenset({'CTRL', 'ALT', 'SHIFT', 'WIN'})
 
-@dataclass 
+ALL_VALID_KEYS = frozenset().union(VALID_FUNCTION_KEYS, VALID_LETTERS, VALID_NUMBERS,
+                                   VALID_SPECIAL_KEYS, VALID_MODIFIERS)
+HEADER_ALIASES = frozenset({"key combination", "key", "combination", "macro"})
+
+READ_BUFFER_SIZE = 1 << 20
+MAX_LOAD_WORKERS = 8
+
+_ROW_FIELDS = operator.itemgetter(0, 1)
+
+@dataclass(frozen=True)
 class MacroConfig:
-    key_combination: list[str]
+    __slots__ = ("key_combination", "action_text")
+    key_combination: List[str]
     action_text: str
 
 @dataclass
@@ -31,27 +44,22 @@ class CSVConfigLoader:
         self.loaded_files: List[str] = []
         self.current_csv_file: Optional[str] = None
         self.errors: List[LoaderError] = []
+        # abspath -> (st_mtime_ns, st_size, parsed rows, errors); a changed stat replaces the entry.
+        # Cached MacroConfig objects are shared by every MacroSet built from the same entry,
+        # so their key_combination lists must not be mutated.
+        self._parse_cache: Dict[str, Tuple[int, int, List[Tuple[int, MacroConfig]], List[LoaderError]]] = {}
 
     def add_error(self, category: ErrorCategory, severity: ErrorSeverity, message: str, line_number: int = 0):
         error = LoaderError(category, severity, message, line_number)
         self.errors.append(error)
 
-    def check_header(self, all_rows) -> list:
-        if len(all_rows[0]) > 0:
-            if (all_rows[0][0].lower() == "key combination" or 
-                all_rows[0][0].lower() == "key" or 
-                all_rows[0][0].lower() == "combination" or
-                all_rows[0][0].lower() == "macro"):
-                all_rows.pop(0)
-        return all_rows
+    def check_header(self, first_row: List[str]) -> bool:
+        if not first_row:
+            return False
+        return first_row[0].strip().lower() in HEADER_ALIASES
     
     def is_valid_key(self, key: str) -> bool:
-        key_upper = key.upper()
-        return (key_upper in VALID_FUNCTION_KEYS or
-                key_upper in VALID_LETTERS or
-                key in VALID_NUMBERS or
-                key_upper in VALID_SPECIAL_KEYS  or
-                key_upper in VALID_MODIFIERS)
+        return key.upper() in ALL_VALID_KEYS
     
     def is_duplicate_key(self, key_list: List[str]) -> bool:
         for macro_set in self.macro_sets:
@@ -60,107 +68,163 @@ class CSVConfigLoader:
                     return True
         return False
 
-    def load_csv_file(self, csv_file_path: str) -> bool:
+    def parse_csv_file(self, csv_file_path: str, 
+                       errors: List[LoaderError]) -> Optional[List[Tuple[int, MacroConfig]]]:
+        with open(csv_file_path, 'r', encoding="utf-8", 
+                  buffering=READ_BUFFER_SIZE, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            first_row = next(reader, None)
+
+            if first_row is None:
+                errors.append(LoaderError(ErrorCategory.FILE, ErrorSeverity.ERROR, 
+                       f"CSV file is empty: {csv_file_path}"))
+                return None
+
+            if self.check_header(first_row):
+                rows = reader
+            else:
+                rows = itertools.chain([first_row], reader)
+            
+            parsed_rows = []
+            key_counts: Dict[Tuple[str, ...], int] = {}
+            row_count = 0
+
+            for row_number, row in enumerate(rows, 1):
+                row_count = row_number
+
+                if not row or len(row) < 2:
+                    errors.append(LoaderError(ErrorCategory.ROW, ErrorSeverity.WARNING, 
+                       f"Row {row_number} has missing fields, skipping"))
+                    continue
+
+                key_combination, action_text = _ROW_FIELDS(row)
+                key_combination = key_combination.strip()
+                action_text = action_text.strip()
+
+                if not key_combination or not action_text:
+                    errors.append(LoaderError(ErrorCategory.ROW, ErrorSeverity.WARNING, 
+                       f"Row {row_number} has empty fields, skipping"))
+                    continue
+
+                key_list = []
+                for key in key_combination.split("+"):
+                    normalized_key = key.strip().upper()
+                    if normalized_key not in ALL_VALID_KEYS:
+                        errors.append(LoaderError(ErrorCategory.ROW, ErrorSeverity.WARNING, 
+                                    f"Row {row_number} has invalid key '{key}' in combination '{key_combination}', skipping"))
+                        key_list = None
+                        break
+                    key_list.append(sys.intern(normalized_key))
+
+                if key_list is None:
+                    continue
+
+                # One warning per earlier row with the same combination
+                key_tuple = tuple(key_list)
+                earlier_count = key_counts.get(key_tuple, 0)
+                for _ in range(earlier_count):
+                    errors.append(LoaderError(ErrorCategory.VALIDATION, ErrorSeverity.WARNING,
+                                f"Row {row_number}: Duplicate key combination '{'+'.join(key_list)}' found in this file, skipping"))
+                key_counts[key_tuple] = earlier_count + 1
+
+                macro = MacroConfig(
+                    key_combination = key_list,
+                    action_text = action_text
+                )
+
+                parsed_rows.append((row_number, macro))
+
+                if len(row) > 2:
+                    errors.append(LoaderError(ErrorCategory.ROW, ErrorSeverity.WARNING, 
+                        f"Row {row_number} has extra columns, ignoring them"))
+
+            if row_count == 0:
+                errors.append(LoaderError(ErrorCategory.FILE, ErrorSeverity.ERROR, 
+                       f"CSV file contains only headers: {csv_file_path}"))
+                return None
+
+        return parsed_rows
+
+    def read_csv_file(self, csv_file_path: str) -> Tuple[Optional[List[Tuple[int, MacroConfig]]], List[LoaderError], 
+                                                         Optional[Tuple[str, int, int]]]:
+        errors: List[LoaderError] = []
 
-        if not os.path.exists(csv_file_path):
-            self.add_error(ErrorCategory.FILE, ErrorSeverity.ERROR, 
-                           f"CSV file cannot be opened: {csv_file_path}")
-            return False
-        
         if not csv_file_path.lower().endswith('.csv'):
-            self.add_error(ErrorCategory.FILE, ErrorSeverity.ERROR, 
-                        f"File must be a .csv file: {csv_file_path}")
-            return False
+            errors.append(LoaderError(ErrorCategory.FILE, ErrorSeverity.ERROR, 
+                        f"File must be a .csv file: {csv_file_path}"))
+            return None, errors, None
 
         try:
-            with open(csv_file_path, 'r', encoding="utf-8") as csvfile:
-                self.current_csv_file = csv_file_path
-                reader = csv.reader(csvfile)
-                all_rows = list(reader)
-
-                if not all_rows:
-                    self.add_error(ErrorCategory.FILE, ErrorSeverity.ERROR, 
-                           f"CSV file is empty: {csv_file_path}")
-                    return False
-    
-                all_rows = self.check_header(all_rows) 
-
-                if not all_rows:
-                    self.add_error(ErrorCategory.FILE, ErrorSeverity.ERROR, 
-                           f"CSV file contains only headers: {csv_file_path}")
-                    return False
-                
-                temp_macros = [] 
-
-                for row_number, row in enumerate(all_rows, 1):
-                    if not row or len(row) < 2:
-                        self.add_error(ErrorCategory.ROW, ErrorSeverity.WARNING, 
-                           f"Row {row_number} has missing fields, skipping")
-                        continue
-
-                    key_combination = row[0].strip()
-                    action_text = row[1].strip()
-
-                    if not key_combination or not action_text:
-                        self.add_error(ErrorCategory.ROW, ErrorSeverity.WARNING, 
-                           f"Row {row_number} has empty fields, skipping")
-                        continue
-
-                    if '+' in key_combination:
-                        key_list = key_combination.split("+")
-                    else:
-                        key_list = [key_combination]
-
-                    valid = True
-                    for key in key_list:
-                        if not self.is_valid_key(key.strip()):
-                            self.add_error(ErrorCategory.ROW, ErrorSeverity.WARNING, 
-                                        f"Row {row_number} has invalid key '{key}' in combination '{key_combination}', skipping")
-                            valid = False
-                            break
-
-                    if not valid:
-                        continue
-
-                    key_list = [key.strip().upper() for key in key_list]
-
-                    if self.is_duplicate_key(key_list):
-                        self.add_error(ErrorCategory.VALIDATION, ErrorSeverity.WARNING,
-                                    f"Row {row_number}: Duplicate key combination '{'+'.join(key_list)}', skipping")
-                        continue
-
-                    for existing_macro in temp_macros:
-                        if existing_macro.key_combination == key_list:
-                            self.add_error(ErrorCategory.VALIDATION, ErrorSeverity.WARNING,
-                                        f"Row {row_number}: Duplicate key combination '{'+'.join(key_list)}' found in this file, skipping")
-                        continue
-
-                    macro = MacroConfig(
-                        key_combination = key_list,
-                        action_text = action_text
-                    )
-
-                    temp_macros.append(macro)
-
-                    if len(row) > 2:
-                        self.add_error(ErrorCategory.ROW, ErrorSeverity.WARNING, 
-                            f"Row {row_number} has extra columns, ignoring them")
-
-            macro_set = MacroSet(
-                file_path=csv_file_path,
-                macros=temp_macros,
-                enabled=True
-            )
-            self.macro_sets.append(macro_set)
-
-            print(f"Successfully loaded {len(self.macro_sets)} macros from '{csv_file_path}'")
-            
-            return True
+            file_stat = os.stat(csv_file_path)
+        except (OSError, ValueError):
+            errors.append(LoaderError(ErrorCategory.FILE, ErrorSeverity.ERROR, 
+                           f"CSV file cannot be opened: {csv_file_path}"))
+            return None, errors, None
+
+        file_key = (os.path.abspath(csv_file_path), file_stat.st_mtime_ns, file_stat.st_size)
+
+        cached = self._parse_cache.get(file_key[0])
+        if cached is not None and cached[:2] == file_key[1:]:
+            return cached[2], cached[3], file_key
+
+        try:
+            return self.parse_csv_file(csv_file_path, errors), errors, file_key
         
-        except Exception as e:
-            self.add_error(ErrorCategory.FILE, ErrorSeverity.ERROR, 
-                           f"Error reading file:  {csv_file_path}")
-        return False
+        except (OSError, csv.Error, UnicodeDecodeError):
+            errors.append(LoaderError(ErrorCategory.FILE, ErrorSeverity.ERROR, 
+                           f"Error reading file:  {csv_file_path}"))
+        return None, errors, file_key
+
+    def register_csv_file(self, csv_file_path: str, parsed_rows: Optional[List[Tuple[int, MacroConfig]]], 
+                          errors: List[LoaderError], file_key: Optional[Tuple[str, int, int]] = None) -> bool:
+        self.errors.extend(errors)
+
+        if file_key is not None:
+            cache_path, mtime_ns, size = file_key
+            if parsed_rows is None:
+                self._parse_cache.pop(cache_path, None)
+            else:
+                self._parse_cache[cache_path] = (mtime_ns, size, parsed_rows, errors)
+
+        if parsed_rows is None:
+            return False
+
+        self.current_csv_file = csv_file_path
+        temp_macros = []
+
+        for row_number, macro in parsed_rows:
+            if self.is_duplicate_key(macro.key_combination):
+                self.add_error(ErrorCategory.VALIDATION, ErrorSeverity.WARNING,
+                            f"Row {row_number}: Duplicate key combination '{'+'.join(macro.key_combination)}', skipping")
+                continue
+
+            temp_macros.append(macro)
+
+        macro_set = MacroSet(
+            file_path=csv_file_path,
+            macros=temp_macros,
+            enabled=True
+        )
+        self.macro_sets.append(macro_set)
+
+        print(f"Successfully loaded {len(self.macro_sets)} macros from '{csv_file_path}'")
+        
+        return True
+
+    def load_csv_file(self, csv_file_path: str) -> bool:
+        return self.register_csv_file(csv_file_path, *self.read_csv_file(csv_file_path))
+
+    def load_many(self, csv_file_paths: List[str]) -> List[bool]:
+        if not csv_file_paths:
+            return []
+
+        # Workers only read the cache; it is updated by register_csv_file on this thread
+        unique_paths = list(dict.fromkeys(csv_file_paths))
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(unique_paths))) as executor:
+            results = dict(zip(unique_paths, executor.map(self.read_csv_file, unique_paths)))
+
+        return [self.register_csv_file(csv_file_path, *results[csv_file_path])
+                for csv_file_path in csv_file_paths]
     
     def get_current_file(self) -> Optional[str]:
         return self.current_csv_file
@@ -170,18 +234,22 @@ class CSVConfigLoader:
             print("No macros loaded")
             return
         
-        print(f"\nLoaded macros from: {self.current_csv_file}")
-        print("-" * 50)
+        lines = [f"\nLoaded macros from: {self.current_csv_file}", "-" * 50]
         for i, macro_set in enumerate(self.macro_sets, 1):
-            print(f"Macro Set {1} ({macro_set.file_path})")
-            for i, macro in enumerate(macro_set.macros, 1):
-                print(f"{i}. Key: '{macro.key_combination}'-> Text: '{macro.action_text}'")
-            print("\n")
+            lines.append(f"Macro Set {1} ({macro_set.file_path})")
+            lines.extend(f"{i}. Key: '{macro.key_combination}'-> Text: '{macro.action_text}'"
+                         for i, macro in enumerate(macro_set.macros, 1))
+            lines.append("\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def run_loader(self):
         self.macro_sets.clear()
         self.errors.clear()
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
 
         while(True):
             print("\nCSV loader")
@@ -194,8 +262,9 @@ class CSVConfigLoader:
 
             success = self.load_csv_file(csv_file_path)
 
-            for error in self.errors:
-                    print(f"{error.severity.value.upper()}! {error.category.value.upper()}: {error.message}")
+            if self.errors:
+                sys.stdout.write("\n".join(f"{error.severity.value.upper()}! {error.category.value.upper()}: {error.message}"
+                                           for error in self.errors) + "\n")
         
             if success:
                 self.print_macros()
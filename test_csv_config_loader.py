@@ -0,0 +1,214 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from CSVConfigurationLoader import CSVConfigLoader
+
+
+class KeyCombinationTests(unittest.TestCase):
+    def setUp(self):
+        self.loader = CSVConfigLoader()
+
+    def test_combinations_match_is_valid_key(self):
+        combinations = {
+            "F1": True, "f12": True, "Ctrl+Shift+F": True, "ctrl + alt + t": True,
+            " Win+Up ": True, "PageDown": True,
+            "F13": False, "Ctrl+": False, "+A": False, "Ctrl++A": False, "SpaceX": False,
+            "Ctrl Shift": False,
+            "Ctrl+\u212a": False,   # Kelvin sign, upper() leaves it unchanged
+            "\u017fhift+A": True,   # long s, upper() gives 'S'
+            "Ctrl+\u0131": True,    # dotless i, upper() gives 'I'
+            "Ctrl+\u00a0A": True,   # no-break space around a key
+            "Ctrl+\u00df": False,   # sharp s, upper() gives 'SS'
+        }
+        for combination, expected in combinations.items():
+            with self.subTest(combination=combination):
+                self.assertEqual(all(self.loader.is_valid_key(key.strip()) for key in combination.split("+")),
+                                 expected)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_file_path = os.path.join(tmp_dir, "combinations.csv")
+            with open(csv_file_path, "w", encoding="utf-8", newline="") as f:
+                f.writelines(f"\"{combination}\",row {i}\n" for i, combination in enumerate(combinations))
+
+            self.assertTrue(self.loader.load_csv_file(csv_file_path))
+
+        loaded = {macro.action_text for macro in self.loader.macro_sets[0].macros}
+        expected = {f"row {i}" for i, valid in enumerate(combinations.values()) if valid}
+        self.assertEqual(loaded, expected)
+
+    def test_kelvin_sign_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_file_path = os.path.join(tmp_dir, "kelvin.csv")
+            with open(csv_file_path, "w", encoding="utf-8") as f:
+                f.write("Ctrl+K,kelvin\nCtrl+K,plain\n")
+
+            self.assertTrue(self.loader.load_csv_file(csv_file_path))
+
+        macros = self.loader.macro_sets[0].macros
+        self.assertEqual([macro.key_combination for macro in macros], [["CTRL", "K"]])
+        self.assertEqual(macros[0].action_text, "plain")
+
+
+class WhitespaceTests(unittest.TestCase):
+    def test_fields_are_stripped_of_all_whitespace(self):
+        loader = CSVConfigLoader()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_file_path = os.path.join(tmp_dir, "whitespace.csv")
+            with open(csv_file_path, "w", encoding="utf-8") as f:
+                f.write("\tF1,\tleading tab\n F3,\u00a0x\n\t ,x\n")
+
+            self.assertTrue(loader.load_csv_file(csv_file_path))
+
+        macros = loader.macro_sets[0].macros
+        self.assertEqual([(macro.key_combination, macro.action_text) for macro in macros],
+                         [(["F1"], "leading tab"), (["F3"], "x")])
+        self.assertEqual([error.message for error in loader.errors], ["Row 3 has empty fields, skipping"])
+
+
+class CSVFileTestCase(unittest.TestCase):
+    FILES = {
+        "excel.csv": ("Key Combination,Action/Text\n"
+                      "F1,=SUM(A1:A10)\n"
+                      "Ctrl+Shift+P,\"=IF(A1>0,\"\"Profit\"\",\"\"Loss\"\")\"\n"
+                      "Bad+Q,skipped\n"
+                      "F3\n"
+                      "F4,text,extra\n"),
+        "code.csv": "F1,duplicate of excel\nctrl + shift + p,also a duplicate\nAlt+C,class\n",
+        "empty.csv": "",
+        "header.csv": "key,text\n",
+        "notes.txt": "F1,x\n",
+    }
+    NAMES = ["excel.csv", "code.csv", "empty.csv", "header.csv", "notes.txt", "missing.csv", "nul\0byte.csv"]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        for name, content in self.FILES.items():
+            with open(self.path(name), "w", encoding="utf-8") as f:
+                f.write(content)
+        self.paths = [self.path(name) for name in self.NAMES]
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp_dir.name, name)
+
+    def snapshot(self, loader: CSVConfigLoader):
+        macro_sets = [(macro_set.file_path, [(macro.key_combination, macro.action_text) for macro in macro_set.macros])
+                      for macro_set in loader.macro_sets]
+        errors = [(error.category, error.severity, error.message) for error in loader.errors]
+        return macro_sets, errors
+
+    def load_sequentially(self, loader: CSVConfigLoader, paths):
+        return [loader.load_csv_file(csv_file_path) for csv_file_path in paths]
+
+
+class LoadTests(CSVFileTestCase):
+    def test_load_csv_file_results(self):
+        loader = CSVConfigLoader()
+        self.assertEqual(self.load_sequentially(loader, self.paths), [True, True, False, False, False, False, False])
+
+        macro_sets, errors = self.snapshot(loader)
+        self.assertEqual(macro_sets, [
+            (self.path("excel.csv"), [(["F1"], "=SUM(A1:A10)"),
+                                      (["CTRL", "SHIFT", "P"], '=IF(A1>0,"Profit","Loss")'),
+                                      (["F4"], "text")]),
+            (self.path("code.csv"), [(["ALT", "C"], "class")]),
+        ])
+        self.assertEqual([message for _, _, message in errors], [
+            "Row 3 has invalid key 'Bad' in combination 'Bad+Q', skipping",
+            "Row 4 has missing fields, skipping",
+            "Row 5 has extra columns, ignoring them",
+            "Row 1: Duplicate key combination 'F1', skipping",
+            "Row 2: Duplicate key combination 'CTRL+SHIFT+P', skipping",
+            f"CSV file is empty: {self.path('empty.csv')}",
+            f"CSV file contains only headers: {self.path('header.csv')}",
+            f"File must be a .csv file: {self.path('notes.txt')}",
+            f"CSV file cannot be opened: {self.path('missing.csv')}",
+            f"CSV file cannot be opened: {self.path('nul' + chr(0) + 'byte.csv')}",
+        ])
+
+    def test_load_many_matches_load_csv_file(self):
+        sequential = CSVConfigLoader()
+        sequential_results = self.load_sequentially(sequential, self.paths)
+
+        concurrent = CSVConfigLoader()
+        self.assertEqual(concurrent.load_many(self.paths), sequential_results)
+        self.assertEqual(self.snapshot(concurrent), self.snapshot(sequential))
+        self.assertEqual(concurrent.load_many([]), [])
+
+    def test_load_many_parses_repeated_paths_once(self):
+        paths = self.paths + [self.path("excel.csv"), self.path("code.csv")]
+
+        sequential = CSVConfigLoader()
+        sequential_results = self.load_sequentially(sequential, paths)
+
+        concurrent = CSVConfigLoader()
+        with mock.patch.object(concurrent, "parse_csv_file", wraps=concurrent.parse_csv_file) as parse:
+            self.assertEqual(concurrent.load_many(paths), sequential_results)
+            self.assertEqual(parse.call_count, 4)
+        self.assertEqual(self.snapshot(concurrent), self.snapshot(sequential))
+
+    def test_read_csv_file_leaves_loader_state_alone(self):
+        loader = CSVConfigLoader()
+        for csv_file_path in self.paths:
+            loader.read_csv_file(csv_file_path)
+
+        self.assertEqual(loader._parse_cache, {})
+        self.assertEqual(loader.errors, [])
+        self.assertEqual(loader.macro_sets, [])
+
+    def test_in_file_duplicates_warn_once_per_earlier_row(self):
+        loader = CSVConfigLoader()
+        csv_file_path = self.path("repeats.csv")
+        with open(csv_file_path, "w", encoding="utf-8") as f:
+            f.write("F1,a\nF2,b\nf1,c\nF1,d\n")
+
+        self.assertTrue(loader.load_csv_file(csv_file_path))
+        self.assertEqual([macro.action_text for macro in loader.macro_sets[0].macros], ["a", "b", "c", "d"])
+        self.assertEqual([error.message for error in loader.errors], [
+            "Row 3: Duplicate key combination 'F1' found in this file, skipping",
+            "Row 4: Duplicate key combination 'F1' found in this file, skipping",
+            "Row 4: Duplicate key combination 'F1' found in this file, skipping",
+        ])
+
+
+class ParseCacheTests(CSVFileTestCase):
+    def test_cache_hits_match_fresh_parse(self):
+        paths = [self.path("excel.csv"), self.path("code.csv"), self.path("excel.csv")]
+
+        fresh = CSVConfigLoader()
+        fresh_results = []
+        for csv_file_path in paths:
+            fresh._parse_cache.clear()
+            fresh_results.append(fresh.load_csv_file(csv_file_path))
+
+        cached = CSVConfigLoader()
+        with mock.patch.object(cached, "parse_csv_file", wraps=cached.parse_csv_file) as parse:
+            self.assertEqual(self.load_sequentially(cached, paths), fresh_results)
+            self.assertEqual(parse.call_count, 2)
+        self.assertEqual(self.snapshot(cached), self.snapshot(fresh))
+
+        concurrent = CSVConfigLoader()
+        concurrent.load_many(paths[:2])
+        with mock.patch.object(concurrent, "parse_csv_file", wraps=concurrent.parse_csv_file) as parse:
+            concurrent.load_many(paths[2:])
+            self.assertEqual(parse.call_count, 0)
+        self.assertEqual(self.snapshot(concurrent), self.snapshot(fresh))
+
+    def test_changed_file_replaces_cache_entry(self):
+        loader = CSVConfigLoader()
+        csv_file_path = self.path("edited.csv")
+        for version in range(1, 6):
+            with open(csv_file_path, "w", encoding="utf-8") as f:
+                f.write(f"F{version},version {version}\n")
+            os.utime(csv_file_path, ns=(version * 10**9, version * 10**9))
+            loader.macro_sets.clear()
+            self.assertTrue(loader.load_csv_file(csv_file_path))
+            self.assertEqual(loader.macro_sets[0].macros[0].action_text, f"version {version}")
+
+        self.assertEqual(len(loader._parse_cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()